@@ -1,22 +1,28 @@
 """Main entry point for the converter."""
 
 import sys
+from pathlib import Path
 from .parser import SchemaParser
 from .verifier import SchemaVerifier
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) != 3:
-        print("Usage: python -m pg_to_knex <input.sql> <output.ts>")
+    args = sys.argv[1:]
+    # --no-cache: re-parse the dump even if cached results exist
+    use_cache = '--no-cache' not in args
+    args = [arg for arg in args if arg != '--no-cache']
+
+    if len(args) != 2:
+        print("Usage: python -m pg_to_knex [--no-cache] <input.sql> <output.ts>")
         sys.exit(1)
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = args[0]
+    output_file = args[1]
 
     print(f"📖 Reading schema from: {input_file}")
     parser = SchemaParser()
-    parser.parse(input_file)
+    parser.parse(input_file, use_cache=use_cache)
 
     print(f"\n✅ Extracted:")
     print(f"   - {len(parser.tables)} tables")
@@ -26,7 +32,7 @@ def main():
 
     # Verify extraction completeness
     print(f"\n🔍 Verifying schema conversion...")
-    verifier = SchemaVerifier(input_file)
+    verifier = SchemaVerifier(input_file, use_cache=use_cache)
     result = verifier.verify(parser)
     verifier.print_report(result)
 
@@ -36,9 +42,7 @@ def main():
 
     print(f"\n📝 Writing migration to: {output_file}")
     migration_code = parser.output()
-
-    with open(output_file, 'w') as f:
-        f.write(migration_code)
+    Path(output_file).write_text(migration_code)
 
     print(f"✨ Done!")
 
@@ -0,0 +1,82 @@
+"""
+On-disk cache of parse and verification results.
+
+Entries are keyed by the dump's path, mtime, size and content hash, and by a
+fingerprint of this package's sources, so neither an edited dump nor edited
+extraction code (e.g. a custom table filter in _patterns.py) is ever served
+stale results. Only the latest entry per dump is kept. Any cache failure
+(unwritable directory, unreadable entry) falls back to a normal run.
+"""
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _cache_dir() -> Path:
+    """Cache directory, following the XDG base directory spec."""
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home or not os.path.isabs(cache_home):
+        cache_home = Path.home() / '.cache'
+    return Path(cache_home) / 'pg_to_knex'
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint() -> str:
+    """Hash of the package's Python sources."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(_PACKAGE_DIR.rglob('*.py')):
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _hex_digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cache_file(kind: str, sql_file_path: str, sql_content) -> Path:
+    """Cache entry for the given kind of result and dump contents."""
+    stat = os.stat(sql_file_path)
+    # The entry name starts with the kind and dump path so that store() can
+    # find and remove the dump's older entries
+    dump_key = _hex_digest(os.path.abspath(sql_file_path).encode())
+    version_key = _hex_digest(repr((
+        _code_fingerprint(),
+        stat.st_mtime_ns,
+        len(sql_content),
+        _hex_digest(sql_content),
+    )).encode())
+    return _cache_dir() / f'{kind}-{dump_key}-{version_key}.pkl'
+
+
+def load(path: Path) -> Optional[Any]:
+    """Return the value cached in an entry, or None."""
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def store(path: Path, value: Any):
+    """Save a value to an entry, replacing older entries for the same dump."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent runs never read a partial entry
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        kind, dump_key, _ = path.stem.split('-')
+        for old_path in path.parent.glob(f'{kind}-{dump_key}-*.pkl'):
+            if old_path != path:
+                old_path.unlink(missing_ok=True)
+    except OSError:
+        pass
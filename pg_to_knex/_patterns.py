@@ -0,0 +1,96 @@
+"""Compiled regular expressions shared by the extractors.
+
+All patterns are compiled once, when the package is imported. Patterns that
+scan the whole dump are bytes patterns (the dump is memory-mapped); patterns
+applied to a decoded CREATE TABLE body are str patterns.
+
+Only the stdlib re engine is used, to keep the package dependency-free. Every
+whole-dump pattern starts with a literal statement prefix and its lazy parts
+stop at the statement terminator, so matching stays linear on pg_dump output.
+STATEMENT_RE also relies on a lookahead, which DFA engines such as RE2 reject.
+"""
+
+import re
+
+# --- Whole-dump scans (bytes) ---
+#
+# Groups are named so a match can be read the same way whether it comes from
+# the statement's own pattern or from STATEMENT_RE.
+
+# Pattern: CREATE TABLE public.table_name (columns);
+# Internal AdonisJS tables are excluded by the lookahead, before their body is scanned
+_TABLE = rb'CREATE TABLE public\.(?!adonis_schema(?:_versions)?\b)(?P<table_name>\w+) \((?P<table_body>.*?)\);'
+
+# Pattern: CREATE [UNIQUE] INDEX index_name ON table_name USING method (columns)
+_INDEX = (
+    rb'CREATE\s+(?P<index_unique>UNIQUE\s+)?INDEX\s+(?P<index_name>\w+)\s+ON\s+public\.(?P<index_table>\w+)'
+    rb'\s+USING\s+\w+\s+\((?P<index_columns>[^)]*)\)'
+)
+
+# Pattern: ALTER TABLE ONLY table_name ADD CONSTRAINT fk_name
+#          FOREIGN KEY (column) REFERENCES ref_table(ref_column) [ON DELETE action]
+# ON DELETE can be: CASCADE, SET NULL, RESTRICT, NO ACTION
+_FK = (
+    rb'ALTER TABLE ONLY public\.(?P<fk_table>\w+)\s+ADD CONSTRAINT \w+\s+FOREIGN KEY\s+\((?P<fk_column>\w+)\)'
+    rb'\s+REFERENCES\s+public\.(?P<fk_ref_table>\w+)\((?P<fk_ref_column>\w+)\)'
+    rb'(?:\s+ON DELETE\s+(?P<fk_on_delete>SET NULL|CASCADE|RESTRICT|NO ACTION))?'
+)
+
+# Pattern: ALTER TABLE table_name ADD CONSTRAINT constraint_name UNIQUE (columns)
+_UNIQUE = (
+    rb'ALTER TABLE (?:ONLY )?public\.(?P<unique_table>\w+)\s+ADD CONSTRAINT (?P<unique_name>\w+)'
+    rb'\s+UNIQUE\s+\((?P<unique_columns>[^)]*)\)'
+)
+
+# Pattern: COMMENT ON COLUMN public.table_name.column_name IS 'comment text';
+_COMMENT = rb"COMMENT ON COLUMN public\.(?P<comment_table>\w+)\.(?P<comment_column>\w+) IS '(?P<comment_text>.+?)';"
+
+TABLE_RE = re.compile(_TABLE, re.DOTALL)
+INDEX_RE = re.compile(_INDEX)
+FK_RE = re.compile(_FK)
+UNIQUE_RE = re.compile(_UNIQUE)
+COMMENT_RE = re.compile(_COMMENT, re.DOTALL)
+
+# All of the above in one alternation, so the dump is walked once. The
+# statement kind is the match's lastgroup. Every statement starts with
+# ALTER, COMMENT or CREATE; the lookahead lets the engine skip other
+# positions without trying each alternative.
+STATEMENT_RE = re.compile(
+    rb'(?=[AC])(?:'
+    rb'(?P<table>' + _TABLE + rb')'
+    rb'|(?P<index>' + _INDEX + rb')'
+    rb'|(?P<fk>' + _FK + rb')'
+    rb'|(?P<unique>' + _UNIQUE + rb')'
+    rb'|(?P<comment>' + _COMMENT + rb')'
+    rb')',
+    re.DOTALL
+)
+
+# --- CREATE TABLE body parsing (str) ---
+
+# One row of a CREATE TABLE body, without surrounding whitespace and trailing commas
+ROW_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<check>CONSTRAINT.*?CHECK.*?)'
+    r'|(?P<constraint>CONSTRAINT.*?)'
+    r'|(?P<column>\S.*?)'
+    r'),*\s*?$',
+    re.MULTILINE
+)
+
+# Pattern: CONSTRAINT ... CHECK ((column = ANY (ARRAY['val1', 'val2'])))
+ENUM_CHECK_RE = re.compile(r'CONSTRAINT\s+\w+\s+CHECK\s+\(\((\w+)\s+=\s+ANY\s+\(ARRAY\[(.+?)\]\)\)\)', re.DOTALL)
+ENUM_VALUE_RE = re.compile(r"'([^']+)'")
+
+# Column definition: "column_name type [constraints]"
+COLUMN_RE = re.compile(r'^(\w+)\s+(.+)$')
+
+# Column type, up to the first constraint keyword or end.
+# Includes: word chars, spaces, parentheses, commas (for numeric(16,8)), brackets (for text[])
+TYPE_RE = re.compile(r'^([\w\s\(\),\[\]]+?)(?:\s+(NOT\s+NULL|DEFAULT|CONSTRAINT)|$)')
+
+# DEFAULT followed by value, stopping at keywords or end
+DEFAULT_RE = re.compile(r'DEFAULT\s+(.+?)(?:\s+(?:NOT\s+NULL|CONSTRAINT)|$)')
+
+# PostgreSQL type cast (::type), e.g. '0'::numeric, 'text'::character varying
+CAST_RE = re.compile(r'::\w+(?:\s+\w+)*')
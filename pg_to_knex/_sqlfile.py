@@ -0,0 +1,22 @@
+"""Access to pg_dump files."""
+
+import mmap
+from contextlib import contextmanager
+
+
+@contextmanager
+def map_sql_file(sql_file_path: str):
+    """
+    Map the dump instead of reading it: callers scan the pages directly
+    with bytes patterns and only decode what they capture.
+    """
+    with open(sql_file_path, 'rb') as f:
+        try:
+            sql_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+
+        with sql_content:
+            yield sql_content
@@ -1,30 +1,26 @@
 """Extracts column comments from PostgreSQL schema."""
 
 import re
+import sys
 from typing import Dict, Tuple
 
+from .._patterns import COMMENT_RE
+
 
 class CommentExtractor:
     """Extracts column comments from PostgreSQL schema."""
 
-    def extract(self, sql_content: str) -> Dict[Tuple[str, str], str]:
+    def extract(self, sql_content: bytes) -> Dict[Tuple[str, str], str]:
         """
         Parse SQL and extract all column comments.
 
         Returns:
             Dict mapping (table_name, column_name) → comment_text
         """
-        comments = {}
-
-        # Pattern: COMMENT ON COLUMN public.table_name.column_name IS 'comment text';
-        pattern = r"COMMENT ON COLUMN public\.(\w+)\.(\w+) IS '(.+?)';"
-        matches = re.finditer(pattern, sql_content, re.DOTALL)
-
-        for match in matches:
-            table_name = match.group(1)
-            column_name = match.group(2)
-            comment_text = match.group(3)
-
-            comments[(table_name, column_name)] = comment_text
+        return dict(self.from_match(m) for m in COMMENT_RE.finditer(sql_content))
 
-        return comments
+    def from_match(self, match: re.Match) -> Tuple[Tuple[str, str], str]:
+        """Build a ((table_name, column_name), comment_text) pair from a COMMENT ON COLUMN match."""
+        table_name = sys.intern(match['comment_table'].decode())
+        column_name = sys.intern(match['comment_column'].decode())
+        return (table_name, column_name), match['comment_text'].decode()
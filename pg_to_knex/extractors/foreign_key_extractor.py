@@ -1,30 +1,27 @@
 """Extracts foreign key constraints from PostgreSQL schema."""
 
 import re
+import sys
 from typing import List
 
 from ..models import ForeignKey
+from .._patterns import FK_RE
 
 
 class ForeignKeyExtractor:
     """Extracts foreign key constraints from PostgreSQL schema."""
 
-    def extract(self, sql_content: str) -> List[ForeignKey]:
+    def extract(self, sql_content: bytes) -> List[ForeignKey]:
         """Parse SQL and extract all foreign keys."""
-        foreign_keys = []
-        # Pattern: ALTER TABLE ONLY table_name ADD CONSTRAINT fk_name
-        #          FOREIGN KEY (column) REFERENCES ref_table(ref_column) [ON DELETE action]
-        # ON DELETE can be: CASCADE, SET NULL, RESTRICT, NO ACTION
-        pattern = r'ALTER TABLE ONLY public\.(\w+)\s+ADD CONSTRAINT \w+\s+FOREIGN KEY\s+\((\w+)\)\s+REFERENCES\s+public\.(\w+)\((\w+)\)(?:\s+ON DELETE\s+(SET NULL|CASCADE|RESTRICT|NO ACTION))?'
-        matches = re.finditer(pattern, sql_content, re.DOTALL)
+        return [self.from_match(m) for m in FK_RE.finditer(sql_content)]
 
-        for match in matches:
-            foreign_keys.append(ForeignKey(
-                table=match.group(1),
-                column=match.group(2),
-                ref_table=match.group(3),
-                ref_column=match.group(4),
-                on_delete=match.group(5)
-            ))
-
-        return foreign_keys
+    def from_match(self, match: re.Match) -> ForeignKey:
+        """Build a foreign key from an ALTER TABLE ... FOREIGN KEY match."""
+        on_delete = match['fk_on_delete']
+        return ForeignKey(
+            table=sys.intern(match['fk_table'].decode()),
+            column=sys.intern(match['fk_column'].decode()),
+            ref_table=sys.intern(match['fk_ref_table'].decode()),
+            ref_column=sys.intern(match['fk_ref_column'].decode()),
+            on_delete=on_delete.decode() if on_delete else None
+        )
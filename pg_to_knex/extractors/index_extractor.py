@@ -1,35 +1,25 @@
 """Extracts index definitions from PostgreSQL schema."""
 
 import re
+import sys
 from typing import List
 
 from ..models import Index
+from .._patterns import INDEX_RE
 
 
 class IndexExtractor:
     """Extracts index definitions from PostgreSQL schema."""
 
-    def extract(self, sql_content: str) -> List[Index]:
+    def extract(self, sql_content: bytes) -> List[Index]:
         """Parse SQL and extract all indexes."""
-        indexes = []
-        # Pattern: CREATE [UNIQUE] INDEX index_name ON table_name USING method (columns)
-        pattern = r'CREATE\s+(UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+public\.(\w+)\s+USING\s+\w+\s+\((.*?)\)'
-        matches = re.finditer(pattern, sql_content, re.DOTALL)
-
-        for match in matches:
-            unique = bool(match.group(1))
-            index_name = match.group(2)
-            table_name = match.group(3)
-            columns_str = match.group(4)
-
-            # Parse column list
-            columns = [col.strip() for col in columns_str.split(',')]
-
-            indexes.append(Index(
-                name=index_name,
-                table=table_name,
-                columns=columns,
-                unique=unique
-            ))
-
-        return indexes
+        return [self.from_match(m) for m in INDEX_RE.finditer(sql_content)]
+
+    def from_match(self, match: re.Match) -> Index:
+        """Build an index from a CREATE INDEX match."""
+        return Index(
+            name=match['index_name'].decode(),
+            table=sys.intern(match['index_table'].decode()),
+            columns=[sys.intern(col.strip()) for col in match['index_columns'].decode().split(',')],
+            unique=bool(match['index_unique'])
+        )
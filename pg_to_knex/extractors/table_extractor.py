@@ -1,45 +1,44 @@
 """Extracts table definitions from PostgreSQL schema."""
 
 import re
+import sys
 from typing import List, Optional
 
-from ..models import Table, Column
+from ..models import Table, Column, CheckConstraint
+from .._patterns import TABLE_RE, ROW_RE, ENUM_CHECK_RE, ENUM_VALUE_RE, COLUMN_RE, TYPE_RE, DEFAULT_RE, CAST_RE
+
+# Column types that make an "id" column the primary key
+_PK_TYPES = frozenset(('integer', 'uuid'))
+# Deletes the sign and decimal point so numeric defaults pass str.isdigit()
+_NUMERIC_CHARS_TRANS = str.maketrans('', '', '.-')
+# Literal defaults that must not be quoted
+_UNQUOTED_LITERALS = frozenset(('true', 'false', 'null'))
 
 
 class TableExtractor:
     """Extracts table definitions from PostgreSQL schema."""
 
-    def extract(self, sql_content: str) -> List[Table]:
+    def extract(self, sql_content: bytes) -> List[Table]:
         """Parse SQL and extract all tables."""
-        tables = []
-        pattern = r'CREATE TABLE public\.(\w+) \((.*?)\);'
-        matches = re.finditer(pattern, sql_content, re.DOTALL)
-
-        for match in matches:
-            table_name = match.group(1)
-            columns_block = match.group(2)
-
-            # Skip internal AdonisJS tables
-            if table_name in ['adonis_schema', 'adonis_schema_versions']:
-                continue
+        return [self.from_match(m) for m in TABLE_RE.finditer(sql_content)]
 
-            table = self._parse_table(table_name, columns_block)
-            tables.append(table)
-
-        return tables
+    def from_match(self, match: re.Match) -> Table:
+        """Build a table from a CREATE TABLE match."""
+        return self._parse_table(sys.intern(match['table_name'].decode()), match['table_body'].decode())
 
     def _parse_table(self, table_name: str, columns_block: str) -> Table:
         """Parse a single table definition."""
         table = Table(name=table_name)
 
-        # Split into lines and process each
-        lines = [line.strip().rstrip(',') for line in columns_block.split('\n') if line.strip()]
-
-        # First pass: Extract CHECK constraints and identify enum-style ones
         enum_constraints = {}  # column_name → [enum_values]
 
-        for line in lines:
-            if line.startswith('CONSTRAINT') and 'CHECK' in line:
+        # Single pass over the block: each non-empty line is tagged as a
+        # CHECK constraint, another constraint (ignored) or a column
+        for match in ROW_RE.finditer(columns_block):
+            kind = match.lastgroup
+
+            if kind == 'check':
+                line = match.group('check')
                 # Try to parse as enum-style CHECK
                 enum_data = self._parse_enum_check(line)
                 if enum_data:
@@ -47,17 +46,19 @@ class TableExtractor:
                     enum_constraints[column_name] = values
                 else:
                     # Not an enum - keep as regular CHECK constraint
-                    table.check_constraints.append(line)
-
-        # Second pass: Parse columns and associate enum values
-        for line in lines:
-            if not line.startswith('CONSTRAINT'):
-                column = self._parse_column(line)
+                    table.check_constraints.append(self._parse_check(line))
+            elif kind == 'column':
+                column = self._parse_column(match.group('column'))
                 if column:
-                    # Check if this column has enum values
-                    if column.name in enum_constraints:
-                        column.enum_values = enum_constraints[column.name]
                     table.columns.append(column)
+                    if column.is_primary_key:
+                        table.has_primary_key = True
+
+        # Associate enum values (CHECK constraints follow the columns in pg_dump output)
+        if enum_constraints:
+            for column in table.columns:
+                if column.name in enum_constraints:
+                    column.enum_values = enum_constraints[column.name]
 
         return table
 
@@ -71,42 +72,59 @@ class TableExtractor:
         """
         # Match the pattern: CONSTRAINT ... CHECK ((column = ANY (ARRAY['val1', 'val2'])))
         # We only care about the column name from the CHECK condition, not the constraint name
-        match = re.match(
-            r'CONSTRAINT\s+\w+\s+CHECK\s+\(\((\w+)\s+=\s+ANY\s+\(ARRAY\[(.+?)\]\)\)\)',
-            check_constraint,
-            re.DOTALL
-        )
+        match = ENUM_CHECK_RE.match(check_constraint)
 
         if not match:
             return None
 
-        column_name = match.group(1)  # Column name from CHECK condition
-        values_str = match.group(2)    # The ARRAY contents
-
-        # Parse enum values from ARRAY['val1'::text, 'val2'::text]
+        # Parse enum values from the ARRAY contents: ARRAY['val1'::text, 'val2'::text]
         # Extract quoted strings
-        value_pattern = r"'([^']+)'"
-        enum_values = re.findall(value_pattern, values_str)
+        enum_values = ENUM_VALUE_RE.findall(match[2])
 
         if not enum_values:
             return None
 
-        return (column_name, enum_values)
+        # Column name from CHECK condition
+        return (match[1], enum_values)
+
+    def _parse_check(self, check_constraint: str) -> CheckConstraint:
+        """
+        Parse a CHECK constraint into its name and condition.
+
+        Pattern: CONSTRAINT name CHECK (condition)
+        """
+        check = CheckConstraint(raw=check_constraint)
+
+        head, _, tail = check_constraint.partition(' CHECK ')
+        head_parts = head.split()
+        if len(head_parts) != 2 or head_parts[0] != 'CONSTRAINT' or not head_parts[1].isidentifier():
+            return check
+
+        check.name = head_parts[1]
+
+        # Condition spans from the first "(" to the last ")"
+        tail = tail.lstrip()
+        close = tail.rfind(')')
+        if tail.startswith('(') and close >= 2:
+            check.condition = tail[1:close].strip()
+
+        return check
 
     def _parse_column(self, col_definition: str) -> Optional[Column]:
         """Parse a single column definition."""
         # Match: "column_name type [constraints]"
-        match = re.match(r'^(\w+)\s+(.+)$', col_definition)
+        match = COLUMN_RE.match(col_definition)
         if not match:
             return None
 
-        col_name = match.group(1)
+        col_name = sys.intern(match.group(1))
         rest = match.group(2)
 
         # Extract type (everything before keywords or end)
-        # Includes: word chars, spaces, parentheses, commas (for numeric(16,8)), brackets (for text[])
-        type_match = re.match(r'^([\w\s\(\),\[\]]+?)(?:\s+(NOT\s+NULL|DEFAULT|CONSTRAINT)|$)', rest)
+        type_match = TYPE_RE.match(rest)
         if not type_match:
+            # Unsupported type (e.g. schema-qualified public.mood): leave the
+            # column out so verification reports it
             return None
 
         col_type = type_match.group(1).strip()
@@ -114,9 +132,14 @@ class TableExtractor:
 
         # Parse constraints
         nullable = 'NOT NULL' not in constraints
-        default = self._extract_default(constraints)
         # Detect primary key: id column that's NOT NULL (integer or uuid)
-        is_pk = (col_name == 'id' and col_type in ('integer', 'uuid') and not nullable)
+        is_pk = col_name == 'id' and not nullable and col_type in _PK_TYPES
+
+        if is_pk and 'nextval(' in constraints:
+            # Serial PK: the sequence default is implied by table.increments()
+            default = None
+        else:
+            default = self._extract_default(constraints)
 
         return Column(
             name=col_name,
@@ -129,7 +152,7 @@ class TableExtractor:
     def _extract_default(self, constraints: str) -> Optional[str]:
         """Extract DEFAULT value from constraints."""
         # Match DEFAULT followed by value, stopping at keywords or end
-        match = re.search(r'DEFAULT\s+(.+?)(?:\s+(?:NOT\s+NULL|CONSTRAINT)|$)', constraints)
+        match = DEFAULT_RE.search(constraints)
         if not match:
             return None
 
@@ -137,14 +160,15 @@ class TableExtractor:
 
         # Remove PostgreSQL type casts (::type)
         # Examples: '0'::numeric, 'text'::character varying, 1::integer
-        default_val = re.sub(r'::\w+(?:\s+\w+)*', '', default_val)
+        # Cast-free values such as false or now() skip the regex
+        default_val = CAST_RE.sub('', default_val) if '::' in default_val else default_val
 
         # Strip quotes if present
         default_val = default_val.strip("'\"")
 
         # Wrap string values in quotes for TypeScript
         # Numbers and booleans should not be quoted
-        if not default_val.replace('.', '').replace('-', '').isdigit() and default_val.lower() not in ['true', 'false', 'null']:
+        if not default_val.translate(_NUMERIC_CHARS_TRANS).isdigit() and default_val.lower() not in _UNQUOTED_LITERALS:
             return f"'{default_val}'"
 
         return default_val
@@ -1,10 +1,10 @@
 """Generators for converting data structures to Knex TypeScript code."""
 
-from .type_mapper import TypeMapper
+from .type_mapper import TypeMapper, map_type
 from .table_generator import TableGenerator
 from .index_generator import IndexGenerator
 from .foreign_key_generator import ForeignKeyGenerator
 from .unique_constraint_generator import UniqueConstraintGenerator
 from .check_constraint_generator import CheckConstraintGenerator
 
-__all__ = ['TypeMapper', 'TableGenerator', 'IndexGenerator', 'ForeignKeyGenerator', 'UniqueConstraintGenerator', 'CheckConstraintGenerator']
+__all__ = ['TypeMapper', 'map_type', 'TableGenerator', 'IndexGenerator', 'ForeignKeyGenerator', 'UniqueConstraintGenerator', 'CheckConstraintGenerator']
@@ -8,13 +8,13 @@ class ForeignKeyGenerator:
 
     def generate(self, fk: ForeignKey) -> str:
         """Generate foreign key constraint code."""
-        code = f'this.schema.alterTable("{fk.table}", (table) => {{\n  table.foreign("{fk.column}").references("{fk.ref_column}").inTable("{fk.ref_table}")'
+        parts = [f'this.schema.alterTable("{fk.table}", (table) => {{\n  table.foreign("{fk.column}").references("{fk.ref_column}").inTable("{fk.ref_table}")']
 
         if fk.on_delete:
-            code += f'.onDelete("{fk.on_delete}")'
+            parts.append(f'.onDelete("{fk.on_delete}")')
 
-        code += '\n})'
-        return code
+        parts.append('\n})')
+        return ''.join(parts)
 
     def generate_drop(self, fk: ForeignKey) -> str:
         """Generate drop foreign key code."""
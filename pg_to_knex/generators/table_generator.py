@@ -1,18 +1,19 @@
 """Generates Knex TypeScript code for tables."""
 
-from typing import Optional
-from ..models import Table, Column
-from .type_mapper import TypeMapper
+from typing import List, Optional
+from ..models import Table, Column, CheckConstraint
+from .type_mapper import map_type
 
 
 class TableGenerator:
     """Generates Knex TypeScript code for tables."""
 
-    def __init__(self):
-        self.type_mapper = TypeMapper()
-
     def generate(self, table: Table) -> str:
         """Generate createTable code for a table."""
+        return '\n'.join(self.generate_lines(table))
+
+    def generate_lines(self, table: Table) -> List[str]:
+        """Generate createTable code for a table as a list of lines, without joining them."""
         lines = [f'this.schema.createTable("{table.name}", (table) => {{']
 
         # Add columns
@@ -21,32 +22,27 @@ class TableGenerator:
             lines.append(f'  {col_code}')
 
         # Add complex CHECK constraints (those not converted to enums)
-        for check_constraint in table.check_constraints:
-            check_code = self._generate_check_constraint(check_constraint)
+        for check in table.check_constraints:
+            check_code = self._generate_check_constraint(check)
             if check_code:
                 lines.append(f'  {check_code}')
 
         lines.append('})')
-        return '\n'.join(lines)
+        return lines
 
-    def _generate_check_constraint(self, check_constraint: str) -> Optional[str]:
+    def _generate_check_constraint(self, check: CheckConstraint) -> Optional[str]:
         """Generate table.check() code for complex CHECK constraints."""
-        import re
-
-        # Parse: CONSTRAINT name CHECK (condition)
-        match = re.match(r'CONSTRAINT\s+(\w+)\s+CHECK\s+\((.+)\)', check_constraint, re.DOTALL)
-        if not match:
+        if check.condition is None:
             return None
 
-        constraint_name = match.group(1)
-        condition = match.group(2).strip()
+        condition = check.condition
 
         # Remove outer parentheses if they exist
         if condition.startswith('(') and condition.endswith(')'):
             condition = condition[1:-1]
 
         # Generate table.check() call
-        return f'table.check("{condition}", undefined, "{constraint_name}")'
+        return f'table.check("{condition}", undefined, "{check.name}")'
 
     def _generate_column(self, column: Column) -> str:
         """Generate Knex code for a single column."""
@@ -57,58 +53,37 @@ class TableGenerator:
                 return f'table.increments("{column.name}").primary()'
             elif column.pg_type == 'uuid':
                 # UUID PK with gen_random_uuid()
-                code = f'table.uuid("{column.name}").primary()'
                 if column.default:
-                    code += f'.defaultTo(this.raw({column.default}))'
-                return code
+                    return f'table.uuid("{column.name}").primary().defaultTo(this.raw({column.default}))'
+                return f'table.uuid("{column.name}").primary()'
 
-        # Handle ENUM columns (from CHECK constraints)
         if column.enum_values:
+            # Handle ENUM columns (from CHECK constraints)
             enum_values_str = ', '.join([f"'{v}'" for v in column.enum_values])
-            code = f'table.enum("{column.name}", [{enum_values_str}])'
+            parts = [f'table.enum("{column.name}", [{enum_values_str}])']
+        else:
+            # Map type
+            method, options = map_type(column.pg_type)
 
-            # Nullable/Not Nullable
-            if column.nullable:
-                code += '.nullable()'
+            if options:
+                parts = [f'table.{method}("{column.name}", {options})']
             else:
-                code += '.notNullable()'
-
-            # Default value
-            if column.default:
-                code += f'.defaultTo({column.default})'
-
-            # Comment
-            if column.comment:
-                escaped_comment = column.comment.replace('"', '\\"')
-                code += f'.comment("{escaped_comment}")'
-
-            return code
-
-        # Map type
-        method, options = self.type_mapper.map(column.pg_type)
-
-        if options:
-            code = f'table.{method}("{column.name}", {options})'
-        else:
-            code = f'table.{method}("{column.name}")'
+                parts = [f'table.{method}("{column.name}")']
 
         # Nullable/Not Nullable
-        if column.nullable:
-            code += '.nullable()'
-        else:
-            code += '.notNullable()'
+        parts.append('.nullable()' if column.nullable else '.notNullable()')
 
         # Default value
         if column.default:
-            code += f'.defaultTo({column.default})'
+            parts.append(f'.defaultTo({column.default})')
 
         # Comment
         if column.comment:
             # Escape quotes in comment
             escaped_comment = column.comment.replace('"', '\\"')
-            code += f'.comment("{escaped_comment}")'
+            parts.append(f'.comment("{escaped_comment}")')
 
-        return code
+        return ''.join(parts)
 
     def generate_drop(self, table: Table) -> str:
         """Generate dropTable code."""
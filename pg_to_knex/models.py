@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """Represents a table column."""
     name: str
@@ -16,15 +16,24 @@ class Column:
     comment: Optional[str] = None  # Column comment/documentation
 
 
-@dataclass
+@dataclass(slots=True)
+class CheckConstraint:
+    """Represents a CHECK constraint that was not converted to an enum."""
+    raw: str  # Constraint definition as written in the dump
+    name: Optional[str] = None  # None if the definition could not be parsed
+    condition: Optional[str] = None  # Expression inside CHECK (...)
+
+
+@dataclass(slots=True)
 class Table:
     """Represents a database table."""
     name: str
     columns: List[Column] = field(default_factory=list)
-    check_constraints: List[str] = field(default_factory=list)
+    check_constraints: List[CheckConstraint] = field(default_factory=list)
+    has_primary_key: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     """Represents a database index."""
     name: str
@@ -33,7 +42,7 @@ class Index:
     unique: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKey:
     """Represents a foreign key constraint."""
     table: str
@@ -43,7 +52,7 @@ class ForeignKey:
     on_delete: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UniqueConstraint:
     """Represents a UNIQUE constraint."""
     name: str
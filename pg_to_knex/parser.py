@@ -1,11 +1,23 @@
 """Orchestrates extraction and generation of migration code."""
 
+import io
 from typing import List
 
+from . import _cache
+from ._patterns import STATEMENT_RE
+from ._sqlfile import map_sql_file
 from .models import Table, Index, ForeignKey, UniqueConstraint
 from .extractors import TableExtractor, IndexExtractor, ForeignKeyExtractor, UniqueConstraintExtractor, CommentExtractor
 from .generators import TableGenerator, IndexGenerator, ForeignKeyGenerator, UniqueConstraintGenerator, CheckConstraintGenerator
 
+# Indentation of statements inside the up()/down() methods
+_BODY_INDENT = ' ' * 4
+
+
+def _quote_columns(columns: List[str]) -> str:
+    """Column names as a comma-separated list of quoted strings."""
+    return '"' + '", "'.join(columns) + '"' if columns else ''
+
 
 class SchemaParser:
     """Orchestrates extraction and generation of migration code."""
@@ -31,34 +43,69 @@ class SchemaParser:
         self.foreign_keys: List[ForeignKey] = []
         self.unique_constraints: List[UniqueConstraint] = []
 
-    def parse(self, sql_file_path: str):
-        """Parse SQL file and extract all schema elements."""
-        with open(sql_file_path, 'r') as f:
-            sql_content = f.read()
+    def parse(self, sql_file_path: str, use_cache: bool = True):
+        """
+        Parse SQL file and extract all schema elements.
 
-        # Extract all elements
-        self.tables = self.table_extractor.extract(sql_content)
-        self.indexes = self.index_extractor.extract(sql_content)
-        self.foreign_keys = self.fk_extractor.extract(sql_content)
-        self.unique_constraints = self.unique_extractor.extract(sql_content)
-        comments = self.comment_extractor.extract(sql_content)
+        Results are cached on disk per dump contents; pass use_cache=False
+        to always re-parse.
+        """
+        self.tables = []
+        self.indexes = []
+        self.foreign_keys = []
+        self.unique_constraints = []
+        comments = {}  # table_name → {column_name → comment}
+
+        # Extract all elements in a single pass over the dump: each statement
+        # match is handed to the extractor for its kind. (Separate extractor
+        # scans can't be overlapped usefully: the regex engine holds the GIL.)
+        with map_sql_file(sql_file_path) as sql_content:
+            cache_file = _cache.cache_file('parse', sql_file_path, sql_content) if use_cache else None
+            cached = _cache.load(cache_file) if cache_file else None
+            if cached is not None:
+                self.tables, self.indexes, self.foreign_keys, self.unique_constraints = cached
+                return
+
+            for match in STATEMENT_RE.finditer(sql_content):
+                kind = match.lastgroup
+
+                if kind == 'table':
+                    self.tables.append(self.table_extractor.from_match(match))
+                elif kind == 'index':
+                    self.indexes.append(self.index_extractor.from_match(match))
+                elif kind == 'fk':
+                    self.foreign_keys.append(self.fk_extractor.from_match(match))
+                elif kind == 'unique':
+                    self.unique_constraints.append(self.unique_extractor.from_match(match))
+                elif kind == 'comment':
+                    (comment_table, comment_column), comment_text = self.comment_extractor.from_match(match)
+                    comments.setdefault(comment_table, {})[comment_column] = comment_text
 
         # Associate comments with columns
         for table in self.tables:
+            table_comments = comments.get(table.name)
+            if not table_comments:
+                continue
+
             for column in table.columns:
-                comment_key = (table.name, column.name)
-                if comment_key in comments:
-                    column.comment = comments[comment_key]
+                comment = table_comments.get(column.name)
+                if comment is not None:
+                    column.comment = comment
+
+        if cache_file:
+            _cache.store(cache_file, (self.tables, self.indexes, self.foreign_keys, self.unique_constraints))
 
     def output(self) -> str:
         """Generate final TypeScript migration file."""
+        # Statements are kept as lists of lines and written indented straight
+        # into the output buffer
         up_statements = []
         down_statements = []
 
         # 1. Create tables (includes CHECK constraints inline)
         for table in self.tables:
-            up_statements.append(self.table_generator.generate(table))
-            down_statements.insert(0, self.table_generator.generate_drop(table))
+            up_statements.append(self.table_generator.generate_lines(table))
+            down_statements.append([self.table_generator.generate_drop(table)])
 
         # 2. Group alterTable operations by table name for efficiency
         alter_table_ops = self._group_alter_table_operations()
@@ -66,33 +113,55 @@ class SchemaParser:
         for table_name, (up_ops, down_ops) in alter_table_ops.items():
             if up_ops:
                 # Generate single alterTable with all operations
-                up_code = f'this.schema.alterTable("{table_name}", (table) => {{\n'
-                up_code += '\n'.join([f'  {op}' for op in up_ops])
-                up_code += '\n})'
-                up_statements.append(up_code)
+                up_statements.append(self._alter_table_lines(table_name, up_ops))
 
             if down_ops:
                 # Generate single alterTable for rollback
-                down_code = f'this.schema.alterTable("{table_name}", (table) => {{\n'
-                down_code += '\n'.join([f'  {op}' for op in down_ops])
-                down_code += '\n})'
-                down_statements.insert(0, down_code)
-
-        up_code = '\n\n'.join(up_statements)
-        down_code = '\n\n'.join(down_statements)
-
-        return f'''import {{ BaseSchema }} from "@adonisjs/lucid/schema"
-
-export default class BaselineMigration extends BaseSchema {{
-  async up() {{
-{self._indent(up_code, 4)}
-  }}
-
-  async down() {{
-{self._indent(down_code, 4)}
-  }}
-}}
-'''
+                down_statements.append(self._alter_table_lines(table_name, down_ops))
+
+        # Roll back in reverse order: alterTable operations first, then drop tables
+        down_statements.reverse()
+
+        buf = io.StringIO()
+        write = buf.write
+
+        write('import { BaseSchema } from "@adonisjs/lucid/schema"\n'
+              '\n'
+              'export default class BaselineMigration extends BaseSchema {\n'
+              '  async up() {\n')
+        self._write_statements(write, up_statements)
+        write('\n'
+              '  }\n'
+              '\n'
+              '  async down() {\n')
+        self._write_statements(write, down_statements)
+        write('\n'
+              '  }\n'
+              '}\n')
+
+        return buf.getvalue()
+
+    def _alter_table_lines(self, table_name: str, ops: List[str]) -> List[str]:
+        """Lines of an alterTable block running the given operations."""
+        lines = [f'this.schema.alterTable("{table_name}", (table) => {{']
+        lines.extend([f'  {op}' for op in ops])
+        lines.append('})')
+        return lines
+
+    def _write_statements(self, write, statements: List[List[str]]):
+        """Write statements indented into a method body, separated by blank lines."""
+        for i, statement in enumerate(statements):
+            if i:
+                write('\n\n')
+
+            text = '\n'.join(statement)
+            if text.count('\n') == len(statement) - 1:
+                # Generated lines are never blank, so all of them get indented
+                write(_BODY_INDENT)
+                write(text.replace('\n', '\n' + _BODY_INDENT))
+            else:
+                # Multi-line comments may contain blank lines, which stay empty
+                write('\n'.join(_BODY_INDENT + line if line.strip() else '' for line in text.split('\n')))
 
     def _group_alter_table_operations(self) -> dict:
         """
@@ -109,25 +178,29 @@ export default class BaselineMigration extends BaseSchema {{
         for index in self.indexes:
             up_op, down_op = self._generate_index_inline(index)
             grouped[index.table][0].append(up_op)
-            grouped[index.table][1].insert(0, down_op)
+            grouped[index.table][1].append(down_op)
 
         # Group UNIQUE constraints by table
         for unique in self.unique_constraints:
             up_op, down_op = self._generate_unique_inline(unique)
             grouped[unique.table][0].append(up_op)
-            grouped[unique.table][1].insert(0, down_op)
+            grouped[unique.table][1].append(down_op)
 
         # Group foreign keys by table
         for fk in self.foreign_keys:
             up_op, down_op = self._generate_fk_inline(fk)
             grouped[fk.table][0].append(up_op)
-            grouped[fk.table][1].insert(0, down_op)
+            grouped[fk.table][1].append(down_op)
+
+        # Down operations run in reverse order
+        for up_ops, down_ops in grouped.values():
+            down_ops.reverse()
 
         return dict(grouped)
 
     def _generate_index_inline(self, index: Index) -> tuple[str, str]:
         """Generate index operations for inline use in alterTable."""
-        columns = ', '.join([f'"{col}"' for col in index.columns])
+        columns = _quote_columns(index.columns)
 
         if index.unique:
             up = f'table.unique([{columns}], "{index.name}")'
@@ -140,21 +213,15 @@ export default class BaselineMigration extends BaseSchema {{
 
     def _generate_unique_inline(self, unique: UniqueConstraint) -> tuple[str, str]:
         """Generate UNIQUE operations for inline use in alterTable."""
-        columns = ', '.join([f'"{col}"' for col in unique.columns])
+        columns = _quote_columns(unique.columns)
         up = f'table.unique([{columns}], "{unique.name}")'
         down = f'table.dropUnique([], "{unique.name}")'
         return (up, down)
 
     def _generate_fk_inline(self, fk: ForeignKey) -> tuple[str, str]:
         """Generate foreign key operations for inline use in alterTable."""
-        up = f'table.foreign("{fk.column}").references("{fk.ref_column}").inTable("{fk.ref_table}")'
-        if fk.on_delete:
-            up += f'.onDelete("{fk.on_delete}")'
+        on_delete = f'.onDelete("{fk.on_delete}")' if fk.on_delete else ''
+        up = f'table.foreign("{fk.column}").references("{fk.ref_column}").inTable("{fk.ref_table}"){on_delete}'
 
         down = f'table.dropForeign(["{fk.column}"])'
         return (up, down)
-
-    def _indent(self, text: str, spaces: int) -> str:
-        """Indent all lines in text."""
-        indent = ' ' * spaces
-        return '\n'.join(indent + line if line.strip() else '' for line in text.split('\n'))
@@ -1,8 +1,44 @@
 """Verifies that schema conversion is complete and accurate."""
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
+import sys
+
+from . import _cache
+from ._sqlfile import map_sql_file
+
+# Whole-dump patterns are bytes: the dump is scanned in place through mmap.
+# Each starts with a literal, which re locates with a fast prefix search, so
+# separate scans stay cheap (a few ms each on large dumps) without a
+# multi-pattern engine.
+_TABLE_RE = re.compile(rb'CREATE TABLE public\.(\w+)')
+_TABLE_HEAD_RE = re.compile(rb'CREATE TABLE public\.(\w+) \(')
+_INDEX_RE = re.compile(rb'CREATE\s+(?:UNIQUE\s+)?INDEX\s+\w+\s+ON\s+public\.')
+_FK_RE = re.compile(rb'ADD CONSTRAINT \w+\s+FOREIGN KEY')
+_UNIQUE_RE = re.compile(rb'ADD CONSTRAINT \w+\s+UNIQUE\s+\(')
+_CHECK_RE = re.compile(rb'CONSTRAINT \w+\s+CHECK\s+\(')
+# AdonisJS internal tables, not part of the migration
+_INTERNAL_TABLES = frozenset(('adonis_schema', 'adonis_schema_versions'))
+# Known mapped types (from TypeMapper)
+_MAPPED_TYPES = frozenset((
+    'integer', 'bigint', 'smallint', 'text', 'character varying',
+    'varchar', 'boolean', 'timestamp with time zone',
+    'timestamp without time zone', 'timestamp', 'date', 'time',
+    'json', 'jsonb', 'uuid', 'numeric', 'real', 'double precision'
+))
+# Column name and type, up to the first constraint keyword. Accepts the same
+# column lines as the table extractor's COLUMN_RE/TYPE_RE, so both sides agree
+# on which types are supported. Applied to single lines, so the lazy type group
+# can't run away; an equivalent scan with str methods measured no faster.
+_COL_RE = re.compile(r'^(\w+)\s+([\w\s\(\),\[\]]+?)(?:\s+(?:NOT\s+NULL|DEFAULT|CONSTRAINT)|$)')
+
+
+@lru_cache(maxsize=None)
+def _base_type(type_str: str) -> str:
+    """Column type without length/precision or array brackets (few distinct values per schema)."""
+    return type_str.strip().split('(')[0].strip().rstrip('[]')
 
 
 @dataclass
@@ -17,18 +53,31 @@ class VerificationResult:
 class SchemaVerifier:
     """Verifies that PostgreSQL schema was completely converted to Knex."""
 
-    def __init__(self, sql_file_path: str):
+    def __init__(self, sql_file_path: str, use_cache: bool = True):
         """Initialize verifier with PostgreSQL schema."""
-        with open(sql_file_path, 'r') as f:
-            self.sql_content = f.read()
-
-        # Extract expected counts from SQL
-        self.expected_tables = self._count_tables()
-        self.expected_columns = self._count_columns_per_table()
-        self.expected_indexes = self._count_indexes()
-        self.expected_foreign_keys = self._count_foreign_keys()
-        self.expected_unique_constraints = self._count_unique_constraints()
-        self.expected_check_constraints = self._count_check_constraints()
+        # All scanning happens here, while the dump is mapped
+        with map_sql_file(sql_file_path) as sql_content:
+            cache_file = _cache.cache_file('verify', sql_file_path, sql_content) if use_cache else None
+            cached = _cache.load(cache_file) if cache_file else None
+            if cached is not None:
+                (self.expected_tables, self.expected_columns, self._sql_types, self.expected_indexes,
+                 self.expected_foreign_keys, self.expected_unique_constraints, self.expected_check_constraints) = cached
+                return
+
+            # Extract expected counts from SQL
+            self.expected_tables = self._count_tables(sql_content)
+            # Column counts and column types both come from the CREATE TABLE blocks,
+            # which are walked once for the two
+            self.expected_columns, self._sql_types = self._scan_table_blocks(sql_content)
+            self.expected_indexes = self._count_indexes(sql_content)
+            self.expected_foreign_keys = self._count_foreign_keys(sql_content)
+            self.expected_unique_constraints = self._count_unique_constraints(sql_content)
+            self.expected_check_constraints = self._count_check_constraints(sql_content)
+
+        if cache_file:
+            _cache.store(cache_file, (self.expected_tables, self.expected_columns, self._sql_types, self.expected_indexes,
+                                      self.expected_foreign_keys, self.expected_unique_constraints,
+                                      self.expected_check_constraints))
 
     def verify(self, parser) -> VerificationResult:
         """
@@ -43,6 +92,37 @@ class SchemaVerifier:
         errors = []
         warnings = []
 
+        # Walk the parsed tables once; the checks below report from these totals
+        total_actual_cols = 0
+        actual_checks = 0
+        actual_enums = 0
+        column_errors = []
+        tables_without_pk = []
+        nullable_id_warnings = []
+
+        for table in parser.tables:
+            columns = table.columns
+            actual_cols = len(columns)
+            total_actual_cols += actual_cols
+            actual_checks += len(table.check_constraints)
+
+            expected_cols = self.expected_columns.get(table.name, 0)
+            if actual_cols != expected_cols:
+                column_errors.append(
+                    f"Table '{table.name}': expected {expected_cols} columns, got {actual_cols}"
+                )
+
+            for col in columns:
+                if col.enum_values:
+                    actual_enums += 1
+                if col.nullable and col.name == 'id':
+                    nullable_id_warnings.append(
+                        f"Table '{table.name}': 'id' column is nullable (unusual)"
+                    )
+
+            if not table.has_primary_key:
+                tables_without_pk.append(table.name)
+
         # 1. Verify table count
         actual_tables = len(parser.tables)
         if actual_tables != self.expected_tables:
@@ -51,16 +131,9 @@ class SchemaVerifier:
             )
 
         # 2. Verify columns per table
-        for table in parser.tables:
-            expected_cols = self.expected_columns.get(table.name, 0)
-            actual_cols = len(table.columns)
-            if actual_cols != expected_cols:
-                errors.append(
-                    f"Table '{table.name}': expected {expected_cols} columns, got {actual_cols}"
-                )
+        errors.extend(column_errors)
 
         # 3. Verify total columns
-        total_actual_cols = sum(len(t.columns) for t in parser.tables)
         total_expected_cols = sum(self.expected_columns.values())
         if total_actual_cols != total_expected_cols:
             errors.append(
@@ -90,8 +163,6 @@ class SchemaVerifier:
 
         # 7. Verify CHECK constraints + ENUMs
         # Some CHECK constraints are converted to .enum() columns
-        actual_checks = sum(len(t.check_constraints) for t in parser.tables)
-        actual_enums = sum(1 for t in parser.tables for c in t.columns if c.enum_values)
         total_constraint_like = actual_checks + actual_enums
 
         if total_constraint_like != self.expected_check_constraints:
@@ -100,19 +171,13 @@ class SchemaVerifier:
             )
 
         # 8. Verify primary keys (all tables should have PKs)
-        tables_without_pk = [t.name for t in parser.tables if not any(c.is_primary_key for c in t.columns)]
         if tables_without_pk:
             warnings.append(
                 f"Tables without primary key: {', '.join(tables_without_pk)}"
             )
 
         # 9. Verify nullable columns are explicitly marked
-        for table in parser.tables:
-            for col in table.columns:
-                if col.nullable and col.name == 'id':
-                    warnings.append(
-                        f"Table '{table.name}': 'id' column is nullable (unusual)"
-                    )
+        warnings.extend(nullable_id_warnings)
 
         # 10. Verify column type coverage
         unmapped_types = self._check_unmapped_types(parser)
@@ -141,92 +206,90 @@ class SchemaVerifier:
             statistics=statistics
         )
 
-    def _count_tables(self) -> int:
+    def _count_tables(self, sql_content: bytes) -> int:
         """Count CREATE TABLE statements (excluding internal tables)."""
-        pattern = r'CREATE TABLE public\.(\w+)'
-        matches = re.findall(pattern, self.sql_content)
+        matches = _TABLE_RE.findall(sql_content)
         # Exclude AdonisJS internal tables
-        return len([t for t in matches if t not in ['adonis_schema', 'adonis_schema_versions']])
+        return len([t for t in matches if t.decode() not in _INTERNAL_TABLES])
+
+    def _iter_table_blocks(self, sql_content: bytes) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (table_name, columns_block) for each CREATE TABLE statement.
+
+        The block runs up to the first ");" like in the parser's table pattern,
+        but is located with find() instead of a lazy DOTALL regex.
+        """
+        block_end = 0
 
-    def _count_columns_per_table(self) -> Dict[str, int]:
-        """Count columns for each table."""
+        for match in _TABLE_HEAD_RE.finditer(sql_content):
+            if match.start() < block_end:
+                # Inside the previous table's block
+                continue
+
+            end = sql_content.find(b');', match.end())
+            if end < 0:
+                # Unterminated statement: no later table can be terminated either
+                return
+
+            block_end = end + 2
+            yield sys.intern(match.group(1).decode()), sql_content[match.end():end].decode()
+
+    def _scan_table_blocks(self, sql_content: bytes) -> Tuple[Dict[str, int], Set[str]]:
+        """
+        Count columns for each table and collect the column types used.
+
+        Returns:
+            (Dict[table_name, column_count], Set[base_type])
+        """
         columns_per_table = {}
-        pattern = r'CREATE TABLE public\.(\w+) \((.*?)\);'
-        matches = re.finditer(pattern, self.sql_content, re.DOTALL)
+        sql_types = set()
 
-        for match in matches:
-            table_name = match.group(1)
-            if table_name in ['adonis_schema', 'adonis_schema_versions']:
+        for table_name, columns_block in self._iter_table_blocks(sql_content):
+            if table_name in _INTERNAL_TABLES:
                 continue
 
-            columns_block = match.group(2)
-            # Count lines that are column definitions (not CONSTRAINT lines)
-            lines = [line.strip() for line in columns_block.split('\n') if line.strip()]
-            col_count = sum(1 for line in lines if not line.startswith('CONSTRAINT'))
+            col_count = 0
+
+            for line in columns_block.split('\n'):
+                line = line.strip()
+                # Only column definitions (not CONSTRAINT lines)
+                if not line or line.startswith('CONSTRAINT'):
+                    continue
+
+                col_count += 1
+
+                # Extract column type
+                col_match = _COL_RE.match(line.rstrip(','))
+                if col_match:
+                    sql_types.add(_base_type(col_match.group(2)))
 
             columns_per_table[table_name] = col_count
 
-        return columns_per_table
+        return columns_per_table, sql_types
 
-    def _count_indexes(self) -> int:
+    def _count_indexes(self, sql_content: bytes) -> int:
         """Count CREATE INDEX statements."""
-        pattern = r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+\w+\s+ON\s+public\.'
-        return len(re.findall(pattern, self.sql_content))
+        return len(_INDEX_RE.findall(sql_content))
 
-    def _count_foreign_keys(self) -> int:
+    def _count_foreign_keys(self, sql_content: bytes) -> int:
         """Count foreign key constraints."""
-        pattern = r'ADD CONSTRAINT \w+\s+FOREIGN KEY'
-        return len(re.findall(pattern, self.sql_content))
+        return len(_FK_RE.findall(sql_content))
 
-    def _count_unique_constraints(self) -> int:
+    def _count_unique_constraints(self, sql_content: bytes) -> int:
         """Count UNIQUE constraints."""
-        pattern = r'ADD CONSTRAINT \w+\s+UNIQUE\s+\('
-        return len(re.findall(pattern, self.sql_content))
+        return len(_UNIQUE_RE.findall(sql_content))
 
-    def _count_check_constraints(self) -> int:
+    def _count_check_constraints(self, sql_content: bytes) -> int:
         """Count CHECK constraints."""
-        pattern = r'CONSTRAINT \w+\s+CHECK\s+\('
-        return len(re.findall(pattern, self.sql_content))
+        return len(_CHECK_RE.findall(sql_content))
 
     def _check_unmapped_types(self, parser) -> Set[str]:
         """Check for PostgreSQL types that might not be mapped."""
-        # Extract all types from SQL - ONLY within CREATE TABLE blocks
-        sql_types = set()
-
-        # Parse CREATE TABLE blocks
-        table_pattern = r'CREATE TABLE public\.(\w+) \((.*?)\);'
-        table_matches = re.finditer(table_pattern, self.sql_content, re.DOTALL)
-
-        for table_match in table_matches:
-            table_name = table_match.group(1)
-            if table_name in ['adonis_schema', 'adonis_schema_versions']:
-                continue
-
-            columns_block = table_match.group(2)
-
-            # Parse column definitions (not CONSTRAINT lines)
-            lines = [line.strip().rstrip(',') for line in columns_block.split('\n') if line.strip()]
-            for line in lines:
-                if line.startswith('CONSTRAINT'):
-                    continue
-
-                # Extract column type
-                col_match = re.match(r'^(\w+)\s+([\w\s\(\),\[\]]+?)(?:\s+(?:NOT\s+NULL|DEFAULT|CONSTRAINT)|$)', line)
-                if col_match:
-                    type_str = col_match.group(2).strip()
-                    base_type = type_str.split('(')[0].strip().rstrip('[]')  # Remove [] for arrays
-                    sql_types.add(base_type)
-
-        # Known mapped types (from TypeMapper)
-        mapped_types = {
-            'integer', 'bigint', 'smallint', 'text', 'character varying',
-            'varchar', 'boolean', 'timestamp with time zone',
-            'timestamp without time zone', 'timestamp', 'date', 'time',
-            'json', 'jsonb', 'uuid', 'numeric', 'real', 'double precision'
-        }
+        # Types used in CREATE TABLE blocks, collected by _scan_table_blocks()
+        sql_types = self._sql_types
 
         # Find unmapped types
-        unmapped = sql_types - mapped_types
+        unmapped = sql_types - _MAPPED_TYPES
 
         return unmapped
 